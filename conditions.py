@@ -1,17 +1,24 @@
 """Conditions are the requirements attached to Pips color regions."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Final, Self
+from functools import lru_cache
+from typing import ClassVar, Final, Self
 
 
 class Condition(ABC):
     """Abstract base class for any condition on a region of a Pips board."""
 
     @classmethod
-    @abstractmethod
     def maybe_parse(cls, condition_string: str) -> Self | None:
         """Parse a condition string if it is valid. Otherwise, return None."""
+        # Every condition type shares the one dispatch table for parsing, and
+        # then only keeps the result if it's the right type of condition.
+        condition = _maybe_parse_any_condition(condition_string)
+        if isinstance(condition, cls):
+            return condition
+        return None
 
     @abstractmethod
     def as_terse_string(self) -> str:
@@ -30,13 +37,6 @@ class Number(Condition):
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({self.number})'
 
-    @classmethod
-    def maybe_parse(cls, condition_string: str) -> Self | None:
-        try:
-            return cls(int(condition_string.strip()))
-        except ValueError:
-            return None
-
     def as_terse_string(self) -> str:
         return str(self.number)
 
@@ -47,12 +47,13 @@ EQUAL_SYMBOL: Final[str] = '='
 @dataclass(frozen=True, slots=True)
 class Equal(Condition):
     """The Pips condition where dots must all be equal."""
+    _instance: ClassVar['Equal | None'] = None
 
-    @classmethod
-    def maybe_parse(cls, condition_string: str) -> Self | None:
-        if condition_string.strip() == EQUAL_SYMBOL:
-            return cls()
-        return None
+    def __new__(cls) -> Self:
+        # This condition has no state, so all instances can be the same one
+        if cls._instance is None:
+            cls._instance = object.__new__(cls)
+        return cls._instance
 
     def as_terse_string(self) -> str:
         return EQUAL_SYMBOL
@@ -64,12 +65,13 @@ NOT_EQUAL_SYMBOL: Final[str] = '=/='
 @dataclass(frozen=True, slots=True)
 class NotEqual(Condition):
     """The Pips condition where dots must all be different."""
+    _instance: ClassVar['NotEqual | None'] = None
 
-    @classmethod
-    def maybe_parse(cls, condition_string: str) -> Self | None:
-        if condition_string.strip() == NOT_EQUAL_SYMBOL:
-            return cls()
-        return None
+    def __new__(cls) -> Self:
+        # This condition has no state, so all instances can be the same one
+        if cls._instance is None:
+            cls._instance = object.__new__(cls)
+        return cls._instance
 
     def as_terse_string(self) -> str:
         return NOT_EQUAL_SYMBOL
@@ -92,19 +94,6 @@ class GreaterThan(Condition):
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({self.number})'
 
-    @classmethod
-    def maybe_parse(cls, condition_string: str) -> Self | None:
-        trimmed_string = condition_string.strip()
-        if not trimmed_string.startswith(GREATER_THAN_PREFIX):
-            return None
-        number_string = trimmed_string.removeprefix(GREATER_THAN_PREFIX)
-        if not number_string.isdigit():
-            return None
-        try:
-            return cls(int(number_string))
-        except ValueError:
-            return None
-
     def as_terse_string(self) -> str:
         return f'{GREATER_THAN_PREFIX}{self.number}'
 
@@ -124,19 +113,6 @@ class LessThan(Condition):
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({self.number})'
 
-    @classmethod
-    def maybe_parse(cls, condition_string: str) -> Self | None:
-        trimmed_string = condition_string.strip()
-        if not trimmed_string.startswith(LESS_THAN_PREFIX):
-            return None
-        number_string = trimmed_string.removeprefix(LESS_THAN_PREFIX)
-        if not number_string.isdigit():
-            return None
-        try:
-            return cls(int(number_string))
-        except ValueError:
-            return None
-
     def as_terse_string(self) -> str:
         return f'{LESS_THAN_PREFIX}{self.number}'
 
@@ -146,10 +122,76 @@ CONDITION_TYPES: Final[list[type[Condition]]] = [
 ]
 
 
+def _parse_digits(number_string: str) -> int | None:
+    """Convert a string of only digits to an int, or return None."""
+    # Signs and underscores aren't allowed after a prefix, but any Unicode
+    # decimal digits are. A few digit characters, like superscripts, pass
+    # isdigit() and then make int() raise ValueError instead.
+    if not number_string.isdigit():
+        return None
+    return int(number_string)
+
+
+def _parse_equal_or_not_equal(trimmed_string: str) -> Condition | None:
+    """Parse a string starting with the equal symbol's first character."""
+    # The equal and not equal symbols share a first character, so they have
+    # to be told apart by the full string.
+    if trimmed_string == EQUAL_SYMBOL:
+        return Equal()
+    if trimmed_string == NOT_EQUAL_SYMBOL:
+        return NotEqual()
+    return None
+
+
+def _parse_greater_than(trimmed_string: str) -> Condition | None:
+    """Parse a string starting with the greater than prefix."""
+    number = _parse_digits(trimmed_string.removeprefix(GREATER_THAN_PREFIX))
+    return None if number is None else GreaterThan(number)
+
+
+def _parse_less_than(trimmed_string: str) -> Condition | None:
+    """Parse a string starting with the less than prefix."""
+    number = _parse_digits(trimmed_string.removeprefix(LESS_THAN_PREFIX))
+    return None if number is None else LessThan(number)
+
+
+def _parse_number(trimmed_string: str) -> Condition | None:
+    """Parse a string without any prefix, which must be a plain number."""
+    # Anything that int() accepts is a valid number, including signs,
+    # underscores, and Unicode digits, so invalid strings raise ValueError.
+    return Number(int(trimmed_string))
+
+
+# Parsers for each type of condition, keyed by the first character of the
+# terse string. The not equal symbol starts with the same character as the
+# equal symbol, and strings without a known first character must be numbers.
+FIRST_CHAR_PARSERS: Final[dict[str, Callable[[str], Condition | None]]] = {
+    EQUAL_SYMBOL[0]: _parse_equal_or_not_equal,
+    GREATER_THAN_PREFIX: _parse_greater_than,
+    LESS_THAN_PREFIX: _parse_less_than,
+}
+
+
+def _maybe_parse_any_condition(condition_string: str) -> Condition | None:
+    """Parse any type of condition string, or return None if it's invalid."""
+    # Strip the string once and find the right parser with one dict lookup
+    # on its first character, instead of trying every condition type in turn.
+    trimmed_string = condition_string.strip()
+    parser = FIRST_CHAR_PARSERS.get(trimmed_string[:1], _parse_number)
+    try:
+        return parser(trimmed_string)
+    except ValueError:
+        return None  # Not a number, or out of range for the condition type
+
+
+# Puzzles reuse a small vocabulary of condition strings, and conditions are
+# immutable, so the parsed result for each string can be shared safely.
+@lru_cache(maxsize=256)
 def parse_condition(condition_string: str) -> Condition:
     """Parse a terse string representation of any Pips region condition."""
-    for ConditionType in CONDITION_TYPES:
-        condition = ConditionType.maybe_parse(condition_string)
-        if condition is not None:
-            return condition
-    raise ValueError(f'invalid terse condition string: {condition_string!r}')
+    condition = _maybe_parse_any_condition(condition_string)
+    if condition is None:
+        raise ValueError(
+            f'invalid terse condition string: {condition_string!r}'
+        )
+    return condition
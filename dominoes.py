@@ -2,15 +2,18 @@
 
 from collections.abc import Iterator
 from dataclasses import dataclass, field
-from typing import Final, Self
+from typing import ClassVar, Final, Self
 
 
 # One half of a domino never has fewer than zero dots or more than six dots.
 MIN_DOTS: Final[int] = 0
 MAX_DOTS: Final[int] = 6
 
+# Every domino covers exactly two spaces on the board, one for each half.
+SPACES_PER_DOMINO: Final[int] = 2
 
-@dataclass(frozen=True, match_args=False, slots=True)
+
+@dataclass(init=False, frozen=True, match_args=False, slots=True)
 class Domino:
     """A single Pips domino piece with two associated dots values."""
     dots: tuple[int, int]
@@ -18,8 +21,22 @@ class Domino:
     # Internally, the two dots values are always stored in sorted order, but I
     # want to remember the order they were input for user-friendliness reasons.
     flip_dots: bool = field(init=False, repr=False, compare=False)
+    # The dots values in their original input order are precomputed once,
+    # since iterating over dominoes is very common in the ILP formulation.
+    _oriented_dots: tuple[int, int] = field(
+        init=False, repr=False, compare=False,
+    )
+
+    # There are only a few dozen possible dominoes, so each one is created
+    # once and then shared, keyed by its dots values in input order. That
+    # makes two entries for each asymmetric domino, one per orientation.
+    _cache: ClassVar[dict[tuple[int, int], 'Domino']] = {}
 
-    def __init__(self, dots_1: int, dots_2: int, /) -> None:
+    def __new__(cls, dots_1: int, dots_2: int, /) -> Self:
+        oriented_dots = (dots_1, dots_2)
+        domino = cls._cache.get(oriented_dots)
+        if domino is not None:
+            return domino
         flip_dots = dots_1 > dots_2
         if flip_dots:
             dots_1, dots_2 = dots_2, dots_1
@@ -27,8 +44,15 @@ class Domino:
             raise ValueError(
                 f'domino dots values must range from {MIN_DOTS} to {MAX_DOTS}'
             )
-        object.__setattr__(self, 'dots', (dots_1, dots_2))
-        object.__setattr__(self, 'flip_dots', flip_dots)
+        domino = object.__new__(cls)
+        object.__setattr__(domino, 'dots', (dots_1, dots_2))
+        object.__setattr__(domino, 'flip_dots', flip_dots)
+        object.__setattr__(domino, '_oriented_dots', oriented_dots)
+        cls._cache[oriented_dots] = domino
+        return domino
+
+    def __getnewargs__(self) -> tuple[int, int]:
+        return self._oriented_dots
 
     @classmethod
     def parse(cls, domino_string: str) -> Self:
@@ -37,9 +61,7 @@ class Domino:
         return cls(int(digit_1), int(digit_2))
 
     def __iter__(self) -> Iterator[int]:
-        if self.flip_dots:
-            return reversed(self.dots)
-        return iter(self.dots)
+        return iter(self._oriented_dots)
 
     def __len__(self) -> int:
         return len(self.dots)
@@ -58,4 +80,4 @@ class Domino:
 
 def parse_dominoes(dominoes_string: str) -> list[Domino]:
     """Parse many domino strings separated by whitespace and return a list."""
-    return list(map(Domino.parse, dominoes_string.strip().split()))
+    return list(map(Domino.parse, dominoes_string.split()))
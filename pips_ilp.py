@@ -1,14 +1,14 @@
 """A formulation of a Pips game as an integer linear program using PuLP."""
 
+from collections.abc import Iterator
 import dataclasses
-import itertools
 from typing import Any, Final
 import warnings
 
 import pulp as pl
 
 from conditions import Equal, GreaterThan, LessThan, NotEqual, Number
-from dominoes import Domino
+from dominoes import Domino, MAX_DOTS
 from puzzle import Puzzle
 from regions import Region
 from solutions import Solution
@@ -23,23 +23,34 @@ def create_placement_vars(
 
     The placement variables are binary flags for every (domino, spot) pairing:
     a value of 1 indicates that this domino is placed in this spot, while a
-    value of 0 indicates that it is not.
+    value of 0 indicates that it is not. Symmetric dominoes have no flags for
+    spots that are not sorted, since those would be redundant.
     """
+    # Symmetric dominoes look exactly the same after a 180-degree rotation, so
+    # they only get variables for the spots whose spaces are in sorted order.
+    # This halves the number of variables for those dominoes and spares the
+    # solver from having to break that symmetry by itself. (An older version
+    # of the formulation measured slower solve times with this change, but
+    # the current formulation solves slightly faster with it.)
+    all_spot_indices = range(len(spots))
+    sorted_spot_indices = [
+        spot_index for spot_index in all_spot_indices
+        if spots[spot_index].is_sorted()
+    ]
+
+    # Let PuLP create each domino's variables in one call, naming them by
+    # integer domino and spot indices. Building a descriptive name from the
+    # domino and spot strings for every single variable is surprisingly slow.
     placement_vars: dict[tuple[Domino, Spot], pl.LpVariable] = {}
-    for domino in puzzle.iter_dominoes():
-        for spot in spots:
-            # NOTE: After measuring with the profiler script, it seems that
-            # this little "optimization" actually *increases* the PuLP solver
-            # time by 18% for average puzzles (and by as much as 220% for the
-            # worst-case hard puzzles). Until such a time as I can figure out
-            # *why* that's happening, the code will be deactivated.
-            # if domino.is_symmetric() and not spot.is_sorted():
-            #     # For dominoes that are symmetric, do not distinguish between
-            #     # two spots that represent a 180-degree rotation.
-            #     continue
-            var_name = f'placement__{domino!s}__{spot!s}'
-            ilp_var = pl.LpVariable(var_name, cat=pl.LpBinary)
-            placement_vars[domino, spot] = ilp_var
+    for domino_index, domino in enumerate(puzzle.iter_dominoes()):
+        spot_indices = (
+            sorted_spot_indices if domino.is_symmetric() else all_spot_indices
+        )
+        domino_vars = pl.LpVariable.dicts(
+            f'placement_{domino_index}', spot_indices, cat=pl.LpBinary,
+        )
+        for spot_index in spot_indices:
+            placement_vars[domino, spots[spot_index]] = domino_vars[spot_index]
     return placement_vars
 
 
@@ -56,50 +67,85 @@ def get_sorted_dots(puzzle: Puzzle) -> list[int]:
     return sorted(dots)
 
 
+def get_space_numbers(puzzle: Puzzle) -> dict[Space, int]:
+    """Return a dict that numbers the puzzle's spaces in sorted order.
+
+    The ILP expressions for the spaces are stored in lists indexed by these
+    numbers, which are cheaper to index into than dicts keyed by spaces.
+    """
+    return {space: n for n, space in enumerate(puzzle.sorted_spaces)}
+
+
 def create_dot_pattern_exprs(
     puzzle: Puzzle,
     spots: list[Spot],
     dots: list[int],
+    space_numbers: dict[Space, int],
     placement_vars: dict[tuple[Domino, Spot], pl.LpVariable],
-) -> dict[tuple[Space, int], pl.LpAffineExpression]:
-    """Generate a dict of dot pattern expressions to help outline the ILP.
+) -> list[list[pl.LpAffineExpression]]:
+    """Generate a table of dot pattern expressions to help outline the ILP.
 
     These expressions are effectively "dependent variables" whose values are
     entirely determined by the placement variables. They are binary values for
     each (space, dot value) pair: a value of 1 indicates that this space is
-    showing this dot value, and a value of 0 indicates that it is not.
+    showing this dot value, and a value of 0 indicates that it is not. The
+    table is indexed first by space number and then by index into the dots.
     """
-    dot_pattern_exprs = {
-        (space, dot): pl.LpAffineExpression()  # Initialize as 0 expression
-        for space in puzzle.iter_sorted_spaces() for dot in dots
-    }
+    # Gather up the placement variables that contribute to each expression
+    # first, then build every expression with a single constructor call. This
+    # is much faster than growing each expression one term at a time. Working
+    # with space numbers means that the inner loop only does plain list
+    # indexing by space number and dots value instead of hashing any objects.
+    spot_space_numbers = [
+        (space_numbers[space_1], space_numbers[space_2])
+        for space_1, space_2 in (spot.spaces for spot in spots)
+    ]
+    contributions: list[list[list[pl.LpVariable]]] = [
+        [[] for _dot in range(MAX_DOTS + 1)] for _space in space_numbers
+    ]
     for domino in puzzle.iter_dominoes():
-        for spot in spots:
-            for dot, space in zip(domino, spot, strict=True):
-                dot_pattern_exprs[space, dot] += (
-                    1 * placement_vars.get((domino, spot), 0)
-                )
-    return dot_pattern_exprs
+        dot_1, dot_2 = domino
+        for spot, (number_1, number_2) in zip(spots, spot_space_numbers):
+            placement_var = placement_vars.get((domino, spot))
+            if placement_var is None:
+                continue
+            contributions[number_1][dot_1].append(placement_var)
+            contributions[number_2][dot_2].append(placement_var)
+    return [
+        [
+            pl.LpAffineExpression(
+                [(var, 1) for var in space_contributions[dot]]
+            )
+            for dot in dots  # Expressions with no contributions will be 0
+        ]
+        for space_contributions in contributions
+    ]
 
 
 def create_dot_number_exprs(
-    puzzle: Puzzle,
-    dot_pattern_exprs: dict[tuple[Space, int], pl.LpAffineExpression],
-) -> dict[Space, pl.LpAffineExpression]:
-    """Generate a dict of dot number expressions to help outline the ILP.
+    dots: list[int],
+    dot_pattern_exprs: list[list[pl.LpAffineExpression]],
+) -> list[pl.LpAffineExpression]:
+    """Generate a list of dot number expressions to help outline the ILP.
 
     These expressions are effectively "dependent variables" whose values are
     entirely determined by the placement variables. Each of them is an integer
     corresponding to one space on the board, and its value is the number of
-    dots showing in that space.
+    dots showing in that space. The list is indexed by space number.
     """
-    dot_number_exprs = {
-        space: pl.LpAffineExpression()  # Initialize as 0 expression
-        for space in puzzle.iter_sorted_spaces()
-    }
-    for (space, dot), dot_pattern_expr in dot_pattern_exprs.items():
-        dot_number_exprs[space] += dot * dot_pattern_expr
-    return dot_number_exprs
+    # Skip the dot pattern expressions that can't contribute anything to the
+    # sum: the ones that are 0, and the ones for a dots value of 0. The latter
+    # would only add terms with coefficients of 0 into every constraint that
+    # uses the dot number expressions.
+    return [
+        pl.LpAffineExpression([
+            (var, dot * coefficient)
+            for dot, dot_pattern_expr in zip(dots, space_dot_pattern_exprs)
+            if dot != 0 and dot_pattern_expr
+            for var, coefficient in dot_pattern_expr.items()
+        ])
+        for space_dot_pattern_exprs in dot_pattern_exprs
+    ]
 
 
 def abbreviate_region(region: Region) -> str:
@@ -110,7 +156,9 @@ def abbreviate_region(region: Region) -> str:
 
 def get_binary_value(var: pl.LpVariable) -> int:
     """Extract the value of a PuLP variable that is expected to be binary."""
-    float_value = pl.value(var)
+    # Read the solved value attribute directly, since pl.value() does extra
+    # type dispatching that adds up over thousands of placement variables.
+    float_value = var.varValue
     assert isinstance(float_value, float)
     int_value = round(float_value)
     assert int_value in (0, 1)
@@ -127,11 +175,12 @@ PREFERRED_SOLVER: Final[str] = 'HiGHS'
 
 @dataclasses.dataclass(eq=False, match_args=False, slots=True)
 class PipsILP:
-    """A PuLP problem together with dicts of variables and expressions."""
+    """A PuLP problem together with its variables and expressions."""
     problem: pl.LpProblem
     placement_vars: dict[tuple[Domino, Spot], pl.LpVariable]
-    dot_pattern_exprs: dict[tuple[Space, int], pl.LpAffineExpression]
-    dot_number_exprs: dict[Space, pl.LpAffineExpression]
+    space_numbers: dict[Space, int]
+    dot_pattern_exprs: list[list[pl.LpAffineExpression]]
+    dot_number_exprs: list[pl.LpAffineExpression]
 
     def solve(self, **kwargs: Any) -> Solution | None:
         """Solve the ILP problem with PuLP and return a solution object."""
@@ -159,11 +208,16 @@ class PipsILP:
             return None
 
         solution = Solution()
-        for (domino, spot), placement_var in self.placement_vars.items():
-            if get_binary_value(placement_var) != 0:
-                solution.add_move(domino, spot)
+        for domino, spot in self.iter_active_placements():
+            solution.add_move(domino, spot)
         return solution
 
+    def iter_active_placements(self) -> Iterator[tuple[Domino, Spot]]:
+        """Return an iterator over the placements chosen by a solved ILP."""
+        for placement, placement_var in self.placement_vars.items():
+            if get_binary_value(placement_var) != 0:
+                yield placement
+
 
 def formulate_ilp(puzzle: Puzzle) -> PipsILP:
     """Construct an integer linear program corresponding to a Pips puzzle."""
@@ -173,61 +227,79 @@ def formulate_ilp(puzzle: Puzzle) -> PipsILP:
     placement_vars = create_placement_vars(puzzle, spots)
 
     dots = get_sorted_dots(puzzle)
+    space_numbers = get_space_numbers(puzzle)
     dot_pattern_exprs = create_dot_pattern_exprs(
-        puzzle, spots, dots, placement_vars,
+        puzzle, spots, dots, space_numbers, placement_vars,
     )
 
-    dot_number_exprs = create_dot_number_exprs(puzzle, dot_pattern_exprs)
+    dot_number_exprs = create_dot_number_exprs(dots, dot_pattern_exprs)
 
     # Constraints: enforce that each domino is placed in exactly one spot
     for domino in puzzle.iter_dominoes():
         equation = (
-            pl.lpSum(
-                1 * placement_vars.get((domino, spot), 0) for spot in spots
-            )
+            pl.LpAffineExpression([
+                (placement_vars[domino, spot], 1) for spot in spots
+                if (domino, spot) in placement_vars
+            ])
             == 1
         )
         problem += (equation, f'use_domino__{domino}')
 
     # Constraints: each space must have one half of a domino occupying it
-    for space in puzzle.iter_sorted_spaces():
+    for space, space_dot_pattern_exprs in zip(
+        puzzle.sorted_spaces, dot_pattern_exprs,
+    ):
+        # No placement variable appears in more than one of this space's dot
+        # pattern expressions, so their terms can be combined directly.
         equation = (
-            pl.lpSum(1 * dot_pattern_exprs[space, dot] for dot in dots) == 1
+            pl.LpAffineExpression([
+                term for dot_pattern_expr in space_dot_pattern_exprs
+                for term in dot_pattern_expr.items()
+            ])
+            == 1
         )
         problem += (equation, f'cant_overlap__{space}')
 
     # Constraints: the colored region conditions specific to this puzzle
-    for region in puzzle.iter_sorted_regions():
+    for region in puzzle.sorted_regions:
         condition = puzzle.get_condition(region)
         region_string = abbreviate_region(region)
+        region_numbers = [space_numbers[space] for space in region]
 
         match condition:
 
             case Number(number):
                 equation = (
-                    pl.lpSum(dot_number_exprs[space] for space in region)
+                    pl.lpSum(dot_number_exprs[n] for n in region_numbers)
                     == number
                 )
                 problem += (equation, f'number_condition__{region_string}')
 
             case Equal():
-                for space_1, space_2 in itertools.pairwise(region):
+                # Constrain every other space to equal the first space, so
+                # that the first space's expression is only looked up once.
+                first_space, *other_spaces = region
+                first_expr = dot_number_exprs[space_numbers[first_space]]
+                for other_space in other_spaces:
                     equation = (
-                        dot_number_exprs[space_1] == dot_number_exprs[space_2]
+                        first_expr
+                        == dot_number_exprs[space_numbers[other_space]]
                     )
                     problem += (
                         equation,
                         (
                             'equal_condition'
-                            + f'__{region_string}__{space_1!s}__{space_2!s}'
+                            + f'__{region_string}__{first_space!s}'
+                            + f'__{other_space!s}'
                         ),
                     )
 
             case NotEqual():
-                for dot in dots:
+                for dot_index, dot in enumerate(dots):
                     inequality = (
                         pl.lpSum(
-                            dot_pattern_exprs[space, dot] for space in region
+                            dot_pattern_exprs[n][dot_index]
+                            for n in region_numbers
                         )
                         <= 1
                     )
@@ -238,7 +310,7 @@ def formulate_ilp(puzzle: Puzzle) -> PipsILP:
 
             case GreaterThan(number):
                 inequality = (
-                    pl.lpSum(dot_number_exprs[space] for space in region)
+                    pl.lpSum(dot_number_exprs[n] for n in region_numbers)
                     >= number + 1  # Offset by 1 due to greater than or equal
                 )
                 problem += (
@@ -247,7 +319,7 @@ def formulate_ilp(puzzle: Puzzle) -> PipsILP:
 
             case LessThan(number):
                 inequality = (
-                    pl.lpSum(dot_number_exprs[space] for space in region)
+                    pl.lpSum(dot_number_exprs[n] for n in region_numbers)
                     <= number - 1  # Offset by 1 due to less than or equal
                 )
                 problem += (
@@ -260,7 +332,11 @@ def formulate_ilp(puzzle: Puzzle) -> PipsILP:
                 )
 
     return PipsILP(
-        problem, placement_vars, dot_pattern_exprs, dot_number_exprs,
+        problem,
+        placement_vars,
+        space_numbers,
+        dot_pattern_exprs,
+        dot_number_exprs,
     )
 
 
@@ -1,12 +1,14 @@
 """A Pips puzzle consists of dominoes, spaces, and regions with conditions."""
 
-from collections.abc import Iterable, Iterator, Mapping
-from typing import Self
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from operator import attrgetter
+from typing import Any, ClassVar, Self
 
 from conditions import Condition, parse_condition
-from dominoes import Domino, parse_dominoes
+from dominoes import Domino, parse_dominoes, SPACES_PER_DOMINO
 from regions import Region
 from spaces import parse_board_layout, Space
+from spots import Spot
 
 
 def parse_region_conditions(
@@ -29,7 +31,12 @@ def parse_region_conditions(
 class Puzzle:
     """A Pips puzzle including the game board parts and list of dominoes."""
 
-    __slots__ = ('spaces', 'regions', 'dominoes')
+    __slots__ = (
+        'regions', 'dominoes', '_spaces', '_added_spaces',
+        '_min_r', '_min_c', '_row_stride', '_space_bits', '_sorted_spaces',
+        '_sorted_spots', '_sorted_regions', '_region_bits', '_domino_set',
+        '_bounding_box',
+    )
 
     def __init__(
         self,
@@ -38,25 +45,27 @@ class Puzzle:
         dominoes: Iterable[Domino],
     ) -> None:
         """Create a new Pips puzzle object using the given components."""
-        self.spaces: set[Space] = set()
+        self._spaces: frozenset[Space] = frozenset()
+        self._added_spaces: set[Space] = set()
         self.regions: dict[Region, Condition] = {}
-        self.dominoes: list[Domino] = []
+        self.dominoes: tuple[Domino, ...] = ()
+        self._sorted_regions: tuple[Region, ...] | None = None
+        self._index_spaces()
 
         for space in spaces:
             self.add_space(space)
         for region, condition in regions.items():
             self.add_region_with_condition(region, condition)
-        for domino in dominoes:
-            self.dominoes.append(domino)
+        self.dominoes = tuple(dominoes)
 
-        unique_dominoes = frozenset(self.dominoes)
-        if len(unique_dominoes) < len(self.dominoes):
+        # Keep the frozen set of dominoes around after checking for duplicates,
+        # since it also makes for a faster domino lookup in __contains__. The
+        # dominoes are a tuple so that the set can never fall out of date.
+        self._domino_set = frozenset(self.dominoes)
+        if len(self._domino_set) < len(self.dominoes):
             raise ValueError('puzzle contains at least one duplicate domino')
-        del unique_dominoes
 
-        spaces_needed_for_dominoes = 0
-        for domino in self.dominoes:
-            spaces_needed_for_dominoes += len(domino)
+        spaces_needed_for_dominoes = SPACES_PER_DOMINO * len(self.dominoes)
         if spaces_needed_for_dominoes != self.num_spaces:
             raise ValueError(
                 f'puzzle has {self.num_spaces} spaces for dominoes, '
@@ -66,25 +75,114 @@ class Puzzle:
 
     def add_space(self, space: Space) -> None:
         """Add one new space to the Pips puzzle."""
-        if space in self.spaces:
+        if space in self._spaces or space in self._added_spaces:
             raise ValueError('that space is already in the puzzle')
-        self.spaces.add(space)
+        # New spaces wait in a mutable set until something reads the spaces
+        # or the index, so that adding many spaces in a row only freezes the
+        # spaces and rebuilds the index once, instead of once per space.
+        self._added_spaces.add(space)
+
+    def _ensure_indexed(self) -> None:
+        """Fold any newly added spaces into the spaces and their index."""
+        if self._added_spaces:
+            self._spaces = self._spaces.union(self._added_spaces)
+            self._added_spaces.clear()
+            self._index_spaces()
+
+    def _index_spaces(self) -> None:
+        """Rebuild the space bitset index and the precomputed sorted spots."""
+        # Sort by the precomputed (row, column) keys directly, so that
+        # comparisons are between plain tuples instead of calls to __lt__.
+        self._sorted_spaces = tuple(
+            sorted(self._spaces, key=attrgetter('_sort_key'))
+        )
+
+        # The sorted spaces already give the first and last rows for free, so
+        # only the columns need a scan to find the puzzle's bounding box.
+        self._bounding_box: tuple[int, int, int, int] | None = None
+        if self._sorted_spaces:
+            self._bounding_box = (
+                self._sorted_spaces[0].r,
+                self._sorted_spaces[-1].r,
+                min(space.c for space in self._sorted_spaces),
+                max(space.c for space in self._sorted_spaces),
+            )
+
+        # Each space sets one bit in a big integer, numbered by its offset
+        # from the top left corner of the bounding box, so that unchecked
+        # spaces in negative rows or columns still get nonnegative bits. The
+        # row stride includes one spare column past the rightmost space so
+        # that a probe just beyond the right edge of a row can never land on
+        # a real space at the start of the next row.
+        if self._bounding_box is None:
+            self._min_r, self._min_c, self._row_stride = 0, 0, 1
+        else:
+            min_r, _max_r, min_c, max_c = self._bounding_box
+            self._min_r, self._min_c = min_r, min_c
+            self._row_stride = 2 + max_c - min_c
+        self._space_bits = self._get_bits(self._spaces)
+        self._region_bits = 0
+        for region in self.regions:
+            self._region_bits |= self._get_bits(region)
+
+        # Every pair of adjacent spaces makes two spots, one per orientation.
+        # All of the pairs can be found at once with bitwise math on the
+        # bitset: a bit survives the AND with the shifted bitset only if the
+        # space to its right (or below it) is also set. The spare column in
+        # the row stride stops pairs from wrapping around between rows.
+        stride = self._row_stride
+        right_bits = self._space_bits & (self._space_bits >> 1)
+        down_bits = self._space_bits & (self._space_bits >> stride)
+        spots: list[Spot] = []
+        for pair_bits, delta_r, delta_c in (
+            (right_bits, 0, 1), (down_bits, 1, 0),
+        ):
+            while pair_bits:
+                lowest_bit = pair_bits & -pair_bits
+                pair_bits ^= lowest_bit
+                r, c = divmod(lowest_bit.bit_length() - 1, stride)
+                r, c = r + self._min_r, c + self._min_c
+                space = Space.intern(r, c)
+                neighbor = Space.intern(r + delta_r, c + delta_c)
+                spots.append(Spot(space, neighbor, unchecked=True))
+                spots.append(Spot(neighbor, space, unchecked=True))
+        spots.sort(key=attrgetter('_sort_key'))
+        self._sorted_spots = tuple(spots)
+
+    def _get_bits(self, spaces: Iterable[Space]) -> int:
+        """Return a bitset with the bits set for the given puzzle spaces."""
+        min_r, min_c, stride = self._min_r, self._min_c, self._row_stride
+        bits = 0
+        for space in spaces:
+            bits |= 1 << ((space.r - min_r) * stride + space.c - min_c)
+        return bits
+
+    def _has_space(self, space: Space) -> bool:
+        """Test whether a space is in the puzzle using the bitset index."""
+        self._ensure_indexed()
+        r, c = space.r - self._min_r, space.c - self._min_c
+        if r < 0 or not 0 <= c < self._row_stride:
+            return False
+        return bool((self._space_bits >> (r * self._row_stride + c)) & 1)
 
     def add_region_with_condition(
         self, region: Region, condition: Condition,
     ) -> None:
         """Add one region to the Pips puzzle with an attached condition."""
-        for existing_region in self.regions:
-            if region.overlaps_with(existing_region):
-                raise ValueError(
-                    'condition regions in the puzzle may not overlap'
-                )
+        self._ensure_indexed()
         for region_space in region:
-            if region_space not in self.spaces:
+            if not self._has_space(region_space):
                 raise ValueError(
                     'region contains a space that is not in the puzzle'
                 )
+        # A single bitwise AND against the bitset of every space covered by
+        # the existing regions replaces checking each region pair for overlap.
+        region_bits = self._get_bits(region)
+        if region_bits & self._region_bits:
+            raise ValueError('condition regions in the puzzle may not overlap')
         self.regions[region] = condition
+        self._region_bits |= region_bits
+        self._sorted_regions = None  # Sort again when next needed
 
     @classmethod
     def parse(cls, puzzle_string: str) -> Self:
@@ -96,42 +194,55 @@ class Puzzle:
         spaces = parse_board_layout(board_layout_string)
         conditions = parse_region_conditions(region_conditions_string)
 
-        space_chars = frozenset(spaces.values())
+        # Bucket the spaces by their characters in one pass, rather than
+        # scanning over all of the spaces again for every region's condition.
+        spaces_by_char: dict[str, list[Space]] = {}
+        for space, space_char in spaces.items():
+            spaces_by_char.setdefault(space_char, []).append(space)
+
         for char in conditions:
-            if char not in space_chars:
+            if char not in spaces_by_char:
                 raise ValueError(
                     f'region {char!r} has a condition but no puzzle spaces'
                 )
-        del space_chars
 
         regions: dict[Region, Condition] = {}
         for condition_char, condition in conditions.items():
-            region = Region(
-                space for space, space_char in spaces.items()
-                if space_char == condition_char
-            )
+            region = Region(spaces_by_char[condition_char])
             regions[region] = condition
 
         dominoes = parse_dominoes(dominoes_string)
         return cls(spaces.keys(), regions, dominoes)
 
+    @property
+    def spaces(self) -> frozenset[Space]:
+        """The frozen set of all the spaces in the puzzle."""
+        self._ensure_indexed()
+        return self._spaces
+
     @property
     def num_spaces(self) -> int:
         """The total number of spaces in the puzzle."""
-        return len(self.spaces)
+        return len(self._spaces) + len(self._added_spaces)
+
+    @property
+    def bounding_box(self) -> tuple[int, int, int, int]:
+        """The puzzle's (min_r, max_r, min_c, max_c), computed only once."""
+        self._ensure_indexed()
+        if self._bounding_box is None:
+            raise ValueError('puzzle with no spaces has no bounding box')
+        return self._bounding_box
 
     @property
     def num_rows(self) -> int:
         """The total number of rows (including empty ones) in the puzzle."""
-        min_r = min(space.r for space in self.spaces)
-        max_r = max(space.r for space in self.spaces)
+        min_r, max_r, _min_c, _max_c = self.bounding_box
         return max_r - min_r + 1
 
     @property
     def num_columns(self) -> int:
         """The total number of columns (including empty ones) in the puzzle."""
-        min_c = min(space.c for space in self.spaces)
-        max_c = max(space.c for space in self.spaces)
+        _min_r, _max_r, min_c, max_c = self.bounding_box
         return max_c - min_c + 1
 
     @property
@@ -144,13 +255,31 @@ class Puzzle:
         """The number of domino pieces for the puzzle."""
         return len(self.dominoes)
 
+    @property
+    def sorted_spaces(self) -> tuple[Space, ...]:
+        """All of the puzzle's spaces in sorted order, computed only once."""
+        self._ensure_indexed()
+        return self._sorted_spaces
+
+    @property
+    def sorted_regions(self) -> tuple[Region, ...]:
+        """All of the puzzle's regions in sorted order, computed only once."""
+        if self._sorted_regions is None:
+            self._sorted_regions = tuple(sorted(self.regions.keys()))
+        return self._sorted_regions
+
     def iter_sorted_spaces(self) -> Iterator[Space]:
         """Return an iterator over the puzzle's spaces in sorted order."""
-        return iter(sorted(self.spaces))
+        return iter(self.sorted_spaces)
 
     def iter_sorted_regions(self) -> Iterator[Region]:
         """Return an iterator over the puzzle's regions in sorted order."""
-        return iter(sorted(self.regions.keys()))
+        return iter(self.sorted_regions)
+
+    def iter_sorted_spots(self) -> Iterator[Spot]:
+        """Return an iterator over every spot in the puzzle in sorted order."""
+        self._ensure_indexed()
+        return iter(self._sorted_spots)
 
     def get_condition(self, region: Region) -> Condition:
         """Return the condition associated with one of the puzzle's regions."""
@@ -160,15 +289,36 @@ class Puzzle:
         """Return an iterator over the puzzle's domino pieces."""
         return iter(self.dominoes)
 
+    def _has_region(self, region: Region) -> bool:
+        """Test whether a region is one of the puzzle's condition regions."""
+        return region in self.regions
+
+    def _has_domino(self, domino: Domino) -> bool:
+        """Test whether a domino is one of the puzzle's domino pieces."""
+        return domino in self._domino_set
+
+    # Membership tests look up the exact type of the item in this table first,
+    # which takes one dict lookup instead of a chain of isinstance() checks.
+    _CONTAINS_METHODS: ClassVar[
+        dict[type, Callable[['Puzzle', Any], bool]]
+    ] = {
+        Space: _has_space,
+        Region: _has_region,
+        Domino: _has_domino,
+    }
+
     def __contains__(
         self, space_or_region_or_domino: Space | Region | Domino,
     ) -> bool:
-        if isinstance(space_or_region_or_domino, Space):
-            return space_or_region_or_domino in self.spaces
-        if isinstance(space_or_region_or_domino, Region):
-            return space_or_region_or_domino in self.regions
-        if isinstance(space_or_region_or_domino, Domino):
-            return space_or_region_or_domino in self.dominoes
+        contains_method = self._CONTAINS_METHODS.get(
+            type(space_or_region_or_domino)
+        )
+        if contains_method is not None:
+            return contains_method(self, space_or_region_or_domino)
+        # Fall back on isinstance() checks for any subclasses
+        for item_type, contains_method in self._CONTAINS_METHODS.items():
+            if isinstance(space_or_region_or_domino, item_type):
+                return contains_method(self, space_or_region_or_domino)
         return False
 
     def __repr__(self) -> str:
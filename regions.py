@@ -1,24 +1,40 @@
 """Pips regions are colored collections of spaces with conditions attached."""
 
 from collections.abc import Iterable, Iterator
-from dataclasses import dataclass
-from typing import Self
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Final, Self
 
 from spaces import Space
 
 
+# Region bitmasks set bit number r * width + c for each space. The width is
+# much wider than any real Pips board, so every region has its own bitmask
+# except ones with spaces in columns or rows beyond that range.
+REGION_MASK_ROW_WIDTH: Final[int] = 64
+
+
 @dataclass(order=True, frozen=True, match_args=False, slots=True)
 class Region:
     """A sorted frozen set containing one or more Pips board spaces."""
     spaces: tuple[Space, ...]
+    # The same spaces as a frozen set, for fast membership and overlap tests
+    _space_set: frozenset[Space] = field(
+        init=False, repr=False, compare=False,
+    )
+    # The same spaces as a bitmask for overlap tests, if they all fit in one
+    _mask: int | None = field(init=False, repr=False, compare=False)
 
     def __init__(self, spaces: Iterable[Space]) -> None:
-        spaces_tuple = tuple(sorted(spaces))
+        spaces_tuple = tuple(sorted(spaces, key=attrgetter('_sort_key')))
         if len(spaces_tuple) < 1:
             raise ValueError('region must contain at least one space')
-        if len(frozenset(spaces_tuple)) < len(spaces_tuple):
+        space_set = frozenset(spaces_tuple)
+        if len(space_set) < len(spaces_tuple):
             raise ValueError('spaces inside a region must be unique')
         object.__setattr__(self, 'spaces', spaces_tuple)
+        object.__setattr__(self, '_space_set', space_set)
+        object.__setattr__(self, '_mask', self._get_mask())
         self._check_connectedness()
 
     def __repr__(self) -> str:
@@ -31,32 +47,50 @@ class Region:
     def __len__(self) -> int:
         return len(self.spaces)
 
+    def __contains__(self, space: object) -> bool:
+        return space in self._space_set
+
+    def _get_mask(self) -> int | None:
+        """Return a bitmask of the region's spaces, or None if it can't fit."""
+        mask = 0
+        for space in self.spaces:
+            if space.r < 0 or not 0 <= space.c < REGION_MASK_ROW_WIDTH:
+                return None
+            mask |= 1 << (space.r * REGION_MASK_ROW_WIDTH + space.c)
+        return mask
+
     def _check_connectedness(self) -> None:
         """Raise an error if the region's spaces are not connected together."""
         # The technique here is to use a breadth-first search (BFS) to explore
         # all the spaces starting with the first one. If we can eventually
         # reach all spaces by stepping to neighbors, then the region is
         # connected. If not, then we need to raise an error.
-        visited: set[Space] = set()
-        frontier: set[Space] = set()
-        frontier.add(next(iter(self)))
-
-        while len(frontier) > 0:
-            space = frontier.pop()
-            visited.add(space)
-
-            neighbors = (
-                space.shift_by(delta_r=+1), space.shift_by(delta_r=-1),
-                space.shift_by(delta_c=+1), space.shift_by(delta_c=-1),
-            )
-            for neighbor in neighbors:
-                if neighbor in self and neighbor not in visited:
-                    frontier.add(neighbor)
-
-        if len(visited) != len(self):
+        #
+        # The region is encoded as a bitmask with one bit per space over its
+        # bounding box, so a whole BFS frontier steps to all of its neighbors
+        # at once with bit shifts. Each row of the box gets a spare column of
+        # zero bits, which stops horizontal shifts from wrapping between rows.
+        min_r = self.spaces[0].r  # The spaces are sorted by row first
+        min_c = min(space.c for space in self.spaces)
+        stride = 2 + max(space.c for space in self.spaces) - min_c
+        region_mask = 0
+        for space in self.spaces:
+            region_mask |= 1 << ((space.r - min_r) * stride + space.c - min_c)
+
+        visited = 0
+        frontier = region_mask & -region_mask  # Only the lowest set bit
+        while frontier:
+            visited |= frontier
+            frontier = (
+                (frontier << 1) | (frontier >> 1)
+                | (frontier << stride) | (frontier >> stride)
+            ) & region_mask & ~visited
+
+        if visited != region_mask:
             raise ValueError('spaces in a region must all be connected')
 
     def overlaps_with(self, other: Self) -> bool:
         """Determine whether two regions have any spaces in common."""
-        set_intersection = frozenset(self).intersection(other)
-        return len(set_intersection) > 0
+        if self._mask is not None and other._mask is not None:
+            return (self._mask & other._mask) != 0
+        return not self._space_set.isdisjoint(other._space_set)
@@ -9,7 +9,7 @@ from pathlib import Path
 import sys
 from typing import Final
 
-from dominoes import Domino
+from dominoes import Domino, MAX_DOTS
 from pips_ilp import formulate_ilp, Spot
 from puzzle import Puzzle
 from spaces import LEFTMOST_COLUMN, Space, TOPMOST_ROW
@@ -39,17 +39,34 @@ LOWER_RIGHT: Final[str] = chr(0x256f)
 # Characters for drawing dominoes: internal fillers
 BLANK: Final[str] = ' '
 
+# Characters for drawing dominoes: dots values, indexed by the number of dots
+DOT_CHARS: Final[tuple[str, ...]] = tuple(map(str, range(MAX_DOTS + 1)))
+
+
+def create_domino_template(height: int, width: int) -> tuple[str, ...]:
+    """Create the rows of characters that outline a blank domino."""
+    inner_width = width - 2
+    top_row = UPPER_LEFT + HORIZONTAL * inner_width + UPPER_RIGHT
+    middle_row = VERTICAL + BLANK * inner_width + VERTICAL
+    bottom_row = LOWER_LEFT + HORIZONTAL * inner_width + LOWER_RIGHT
+    return (top_row,) + (middle_row,) * (height - 2) + (bottom_row,)
+
+
+# Outlines for blank dominoes in each orientation, stamped onto the grid row
+# by row so that drawing a domino doesn't have to place every edge character
+HORIZONTAL_TEMPLATE: Final[tuple[str, ...]] = create_domino_template(
+    SPACE_SIZE, DOMINO_LENGTH,
+)
+VERTICAL_TEMPLATE: Final[tuple[str, ...]] = create_domino_template(
+    DOMINO_LENGTH, SPACE_SIZE,
+)
+
 
 def create_blank_grid(puzzle: Puzzle) -> list[list[str]]:
     """Create a blank grid of characters to be filled for the visualization."""
     grid_height = SPACE_SIZE * puzzle.num_rows + OUTER_BORDER * 2
     grid_width = SPACE_SIZE * puzzle.num_columns + OUTER_BORDER * 2
-    grid: list[list[str]] = []
-    for _y in range(grid_height):
-        grid.append([])
-        for _x in range(grid_width):
-            grid[-1].append(BLANK)
-    return grid
+    return [[BLANK] * grid_width for _y in range(grid_height)]
 
 
 def transform_coordinates(space: Space) -> tuple[int, int]:
@@ -75,56 +92,18 @@ def draw_domino(grid: list[list[str]], domino: Domino, spot: Spot) -> None:
 
     y_top = min(y1, y2) - HALF_SIZE
     x_left = min(x1, x2) - HALF_SIZE
-    height = SPACE_SIZE if spot.is_horizontal() else DOMINO_LENGTH
-    width = SPACE_SIZE if spot.is_vertical() else DOMINO_LENGTH
-    y_bottom = y_top + height - 1
-    x_right = x_left + width - 1
+    template = (
+        HORIZONTAL_TEMPLATE if spot.is_horizontal() else VERTICAL_TEMPLATE
+    )
+
+    # Stamp the domino outline onto the grid one row at a time
+    for y, template_row in enumerate(template, start=y_top):
+        grid[y][x_left:x_left + len(template_row)] = template_row
 
     # Draw the domino dots values
     dot_1, dot_2 = domino
-    grid[y1][x1] = str(dot_1)
-    grid[y2][x2] = str(dot_2)
-
-    # Draw the domino corners
-    grid[y_top][x_left] = UPPER_LEFT
-    grid[y_top][x_right] = UPPER_RIGHT
-    grid[y_bottom][x_left] = LOWER_LEFT
-    grid[y_bottom][x_right] = LOWER_RIGHT
-
-    # Draw the straight domino edges
-    if spot.is_horizontal():
-
-        # Top and bottom edges of left half
-        for i in range(1, SPACE_SIZE):
-            grid[y_top][x_left + i] = HORIZONTAL
-            grid[y_bottom][x_left + i] = HORIZONTAL
-
-        # Top and bottom edges of right half
-        for i in range(1, SPACE_SIZE):
-            grid[y_top][x_right - i] = HORIZONTAL
-            grid[y_bottom][x_right - i] = HORIZONTAL
-
-        # Left and right edges
-        for i in range(1, SPACE_SIZE - 1):
-            grid[y_top + i][x_left] = VERTICAL
-            grid[y_top + i][x_right] = VERTICAL
-
-    else:  # The spot is vertical
-
-        # Left and right edges of top half
-        for i in range(1, SPACE_SIZE):
-            grid[y_top + i][x_left] = VERTICAL
-            grid[y_top + i][x_right] = VERTICAL
-
-        # Left and right edges of bottom half
-        for i in range(1, SPACE_SIZE):
-            grid[y_bottom - i][x_left] = VERTICAL
-            grid[y_bottom - i][x_right] = VERTICAL
-
-        # Top and bottom edges
-        for i in range(1, SPACE_SIZE - 1):
-            grid[y_top][x_left + i] = HORIZONTAL
-            grid[y_bottom][x_left + i] = HORIZONTAL
+    grid[y1][x1] = DOT_CHARS[dot_1]
+    grid[y2][x2] = DOT_CHARS[dot_2]
 
 
 def main(puzzle_file: Path) -> None:
@@ -1,7 +1,9 @@
 """Spaces are the individual half-domino squares that make up a Pips board."""
 
-from dataclasses import dataclass
-from typing import Final, Self
+from dataclasses import dataclass, field
+from functools import total_ordering
+import re
+from typing import ClassVar, Final, Self
 
 
 # The topmost row on a Pips board is always row 1. The leftmost column is
@@ -9,12 +11,29 @@ from typing import Final, Self
 TOPMOST_ROW: Final[int] = 1
 LEFTMOST_COLUMN: Final[int] = 1
 
+# Spaces are hashed using one integer key that packs the row and column
+# numbers together as r * scale + c. The keys are unique for any column number
+# smaller in magnitude than half the scale, which is far beyond the size of any
+# real Pips board. Columns have no upper bound, though, so the packed key is
+# only ever used as a hash and never to compare or sort spaces.
+HASH_KEY_ROW_SCALE: Final[int] = 1 << 16
 
-@dataclass(order=True, frozen=True, slots=True)
+
+@total_ordering
+@dataclass(eq=False, frozen=True, slots=True)
 class Space:
     """Row and column coordinates for one space on a Pips board."""
     r: int  # Row number
     c: int  # Column number
+    # The (row, column) pair that spaces are sorted by, precomputed once
+    _sort_key: tuple[int, int] = field(init=False, repr=False, compare=False)
+    _hash_key: int = field(init=False, repr=False, compare=False)
+
+    # Interned space objects shared by the hot neighbor-probing code paths,
+    # keyed by their (row, column) coordinates. Reusing one object per
+    # coordinate pair saves an allocation for every probe and lets set and
+    # dict lookups succeed on the identity check.
+    _cache: ClassVar[dict[tuple[int, int], 'Space']] = {}
 
     def __init__(self, r: int, c: int, *, unchecked: bool = False) -> None:
         if not unchecked:
@@ -28,6 +47,27 @@ class Space:
                 )
         object.__setattr__(self, 'r', r)
         object.__setattr__(self, 'c', c)
+        object.__setattr__(self, '_sort_key', (r, c))
+        object.__setattr__(self, '_hash_key', r * HASH_KEY_ROW_SCALE + c)
+
+    @classmethod
+    def _make(cls, r: int, c: int) -> Self:
+        """Create an unchecked space object without going through __init__."""
+        space = object.__new__(cls)
+        object.__setattr__(space, 'r', r)
+        object.__setattr__(space, 'c', c)
+        object.__setattr__(space, '_sort_key', (r, c))
+        object.__setattr__(space, '_hash_key', r * HASH_KEY_ROW_SCALE + c)
+        return space
+
+    @classmethod
+    def intern(cls, r: int, c: int) -> 'Space':
+        """Return the shared unchecked space object for these coordinates."""
+        key = (r, c)
+        space = cls._cache.get(key)
+        if space is None:
+            space = cls._cache[key] = cls._make(r, c)
+        return space
 
     @classmethod
     def parse(cls, space_string: str) -> Self:
@@ -38,15 +78,39 @@ class Space:
     def __str__(self) -> str:
         return f'{self.r},{self.c}'
 
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        assert isinstance(other, Space)  # For the type checker
+        # Compare the coordinates themselves, since columns have no upper bound
+        # and so two different spaces could share the same packed hash key
+        return self.r == other.r and self.c == other.c
+
+    def __hash__(self) -> int:
+        # An int key is already a fine hash, and Python reduces it to hash
+        # size. Equal spaces always share a key, and rare collisions are fine.
+        return self._hash_key
+
+    def __lt__(self, other: Self) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._sort_key < other._sort_key
+
     def shift_by(
         self, *, delta_r: int | None = None, delta_c: int | None = None,
-    ) -> Self:
+    ) -> 'Space':
         """Return another space shifted by some number of rows or columns."""
         if delta_r is None and delta_c is None:
             raise TypeError('must specify at least one of delta_r or delta_c')
+        if not delta_r and not delta_c:
+            return self  # No need to look up a space if there's no shift
         new_r = self.r if delta_r is None else self.r + delta_r
         new_c = self.c if delta_c is None else self.c + delta_c
-        return self.__class__(new_r, new_c, unchecked=True)
+        return self.__class__.intern(new_r, new_c)
+
+
+# Each match of this pattern is one space character in a board layout line
+NON_WHITESPACE_PATTERN: Final[re.Pattern[str]] = re.compile(r'\S')
 
 
 def parse_board_layout(board_layout_string: str) -> dict[Space, str]:
@@ -56,26 +120,31 @@ def parse_board_layout(board_layout_string: str) -> dict[Space, str]:
     # columns on the Pips board.
     board_layout_lines = board_layout_string.splitlines()
 
+    # Before creating any spaces, find how many empty rows lead the layout
+    # and how many empty columns are at the left so that every space can be
+    # created at its final, shifted position in a single pass.
+    row_offset = next(
+        (r for r, line in enumerate(board_layout_lines) if line.strip()),
+        len(board_layout_lines),
+    )
+    column_offset = min(
+        (
+            len(line) - len(line.lstrip())
+            for line in board_layout_lines if line.strip()
+        ),
+        default=0,
+    )
+
+    # Let the regex engine scan each line for the non-whitespace characters,
+    # rather than stepping through every character of the line in Python.
     spaces: dict[Space, str] = {}
-    for r, line in enumerate(board_layout_lines, start=TOPMOST_ROW):
-        for c, char in enumerate(line, start=LEFTMOST_COLUMN):
-            if char.isspace():
-                continue
-            assert len(char) == 1
-            space = Space(r, c)
+    for r, line in enumerate(
+        board_layout_lines[row_offset:], start=TOPMOST_ROW,
+    ):
+        for char_match in NON_WHITESPACE_PATTERN.finditer(line, column_offset):
+            c = char_match.start() - column_offset + LEFTMOST_COLUMN
+            space = Space.intern(r, c)
             assert space not in spaces
-            spaces[space] = char
-
-    # Shift the space coordinates mathematically to remove any empty top rows
-    # or empty left columns if either of those exist.
-    r_min = min(space.r for space in spaces)
-    c_min = min(space.c for space in spaces)
-    if r_min != TOPMOST_ROW or c_min != LEFTMOST_COLUMN:
-        delta_r = TOPMOST_ROW - r_min
-        delta_c = LEFTMOST_COLUMN - c_min
-        spaces = {
-            space.shift_by(delta_r=delta_r, delta_c=delta_c): char
-            for (space, char) in spaces.items()
-        }
+            spaces[space] = char_match[0]
 
     return spaces
@@ -1,22 +1,41 @@
 """Spots are ordered pairs of adjacent spaces where dominos may be placed."""
 
 from collections.abc import Iterator
-from dataclasses import dataclass
-from typing import Self
+from dataclasses import dataclass, field
+from functools import total_ordering
+from typing import Self, TYPE_CHECKING
 
-from puzzle import Puzzle
 from spaces import Space
 
+if TYPE_CHECKING:
+    from puzzle import Puzzle
 
-@dataclass(order=True, frozen=True, match_args=False, slots=True)
+
+@total_ordering
+@dataclass(frozen=True, match_args=False, slots=True)
 class Spot:
     """An ordered pair of adjacent spaces where a domino could be placed."""
     spaces: tuple[Space, Space]
+    # Spots are sorted by the coordinates of their two spaces, precomputed
+    # once since sorting all the spots in a puzzle does many comparisons.
+    _sort_key: tuple[int, int, int, int] = field(
+        init=False, repr=False, compare=False,
+    )
 
-    def __init__(self, space_1: Space, space_2: Space, /) -> None:
-        if abs(space_2.r - space_1.r) + abs(space_2.c - space_1.c) != 1:
-            raise ValueError('spot must be made up of two adjacent spaces')
+    def __init__(
+        self, space_1: Space, space_2: Space, /, *, unchecked: bool = False,
+    ) -> None:
+        if not unchecked:
+            # The squares of the two coordinate differences can only add up to
+            # exactly 1 if one difference is +/-1 and the other is 0.
+            delta_r = space_2.r - space_1.r
+            delta_c = space_2.c - space_1.c
+            if delta_r * delta_r + delta_c * delta_c != 1:
+                raise ValueError('spot must be made up of two adjacent spaces')
         object.__setattr__(self, 'spaces', (space_1, space_2))
+        object.__setattr__(
+            self, '_sort_key', (*space_1._sort_key, *space_2._sort_key),
+        )
 
     @classmethod
     def parse(cls, spot_string: str) -> Self:
@@ -33,6 +52,11 @@ class Spot:
     def __str__(self) -> str:
         return ':'.join(map(str, self))
 
+    def __lt__(self, other: Self) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._sort_key < other._sort_key
+
     def is_sorted(self) -> bool:
         """Return True if this spot's two spaces occur in sorted order."""
         space_1, space_2 = self
@@ -56,15 +80,8 @@ class Spot:
         return any((space in other) for space in self)
 
 
-def get_sorted_spots(puzzle: Puzzle) -> list[Spot]:
+def get_sorted_spots(puzzle: 'Puzzle') -> list[Spot]:
     """Return a sorted list of every spot where a domino could be placed."""
-    spots: set[Spot] = set()
-    for space in puzzle.iter_sorted_spaces():
-        neighbors = (
-            space.shift_by(delta_r=+1), space.shift_by(delta_r=-1),
-            space.shift_by(delta_c=+1), space.shift_by(delta_c=-1),
-        )
-        for neighbor in neighbors:
-            if neighbor in puzzle:
-                spots.add(Spot(space, neighbor))
-    return sorted(spots)
+    # The puzzle already works out all of its spots whenever its spaces are
+    # set, so there is no need to search for adjacent spaces again here.
+    return list(puzzle.iter_sorted_spots())
@@ -0,0 +1,13 @@
+"""Assertion helpers shared between the unit tests for the Pips classes."""
+
+from dataclasses import FrozenInstanceError
+import unittest
+
+
+def assert_frozen(
+    test_case: unittest.TestCase, obj: object, **values: object,
+) -> None:
+    """Check that assigning each given attribute value to an object raises."""
+    for name, value in values.items():
+        with test_case.assertRaises(FrozenInstanceError):
+            setattr(obj, name, value)
@@ -1,6 +1,5 @@
 """Unit tests for the series of region Condition subclasses."""
 
-from dataclasses import FrozenInstanceError
 from typing import Final
 import unittest
 
@@ -17,17 +16,18 @@ from conditions import (
     Number,
     parse_condition,
 )
+from tests.helpers import assert_frozen
 
 
-# Test fixture: a constant list containing a bunch of strings that shouldn't
+# Test fixture: a constant tuple containing a bunch of strings that shouldn't
 # parse correctly as *any* type of condition.
-INVALID_CONDITION_STRINGS: Final[list[str]] = [
+INVALID_CONDITION_STRINGS: Final[tuple[str, ...]] = (
     '32a', 'b4', 'abc', 'x6y', 'f',
     '', ' ', '\t', '\n',
     '>', '<', '4>', '5<', '>=', '<=', '>=2', '<=3',
     '=5', '==7', '1=', '=8=',
     '!=', '==', '=\\=', '/=', '=/', '\\=', '=\\',
-]
+)
 
 
 class TestConditions(unittest.TestCase):
@@ -43,8 +43,7 @@ class TestConditions(unittest.TestCase):
 
         self.assertEqual(condition, Number(4))
         self.assertEqual(condition.number, 4)
-        with self.assertRaises(FrozenInstanceError):
-            setattr(condition, 'number', 6)
+        assert_frozen(self, condition, number=condition.number + 1)
 
         self.assertEqual(repr(condition), 'Number(4)')
         self.assertEqual(condition.as_terse_string(), '4')
@@ -58,9 +57,6 @@ class TestConditions(unittest.TestCase):
         self.assertIsNone(Number.maybe_parse(EQUAL_SYMBOL))
         self.assertIsNone(Number.maybe_parse(NOT_EQUAL_SYMBOL))
 
-        for invalid in INVALID_CONDITION_STRINGS:
-            self.assertIsNone(Number.maybe_parse(invalid))
-
     def test_equal_condition(self):
         """Make sure "equal" conditions behave correctly."""
         condition = parse_condition(EQUAL_SYMBOL)
@@ -69,6 +65,7 @@ class TestConditions(unittest.TestCase):
         self.assertIsInstance(condition, Equal)
 
         self.assertEqual(condition, Equal())
+        self.assertIs(condition, Equal())
 
         self.assertEqual(repr(condition), 'Equal()')
         self.assertEqual(condition.as_terse_string(), EQUAL_SYMBOL)
@@ -79,9 +76,6 @@ class TestConditions(unittest.TestCase):
         self.assertIsNone(Equal.maybe_parse(GREATER_THAN_PREFIX + '14'))
         self.assertIsNone(Equal.maybe_parse(LESS_THAN_PREFIX + '11'))
 
-        for invalid in INVALID_CONDITION_STRINGS:
-            self.assertIsNone(Equal.maybe_parse(invalid))
-
     def test_not_equal_condition(self):
         """Make sure "not equal" conditions behave correctly."""
         condition = parse_condition(NOT_EQUAL_SYMBOL)
@@ -90,6 +84,7 @@ class TestConditions(unittest.TestCase):
         self.assertIsInstance(condition, NotEqual)
 
         self.assertEqual(condition, NotEqual())
+        self.assertIs(condition, NotEqual())
 
         self.assertEqual(repr(condition), 'NotEqual()')
         self.assertEqual(condition.as_terse_string(), NOT_EQUAL_SYMBOL)
@@ -100,9 +95,6 @@ class TestConditions(unittest.TestCase):
         self.assertIsNone(NotEqual.maybe_parse(GREATER_THAN_PREFIX + '5'))
         self.assertIsNone(NotEqual.maybe_parse(LESS_THAN_PREFIX + '3'))
 
-        for invalid in INVALID_CONDITION_STRINGS:
-            self.assertIsNone(NotEqual.maybe_parse(invalid))
-
     def test_greater_than_condition(self):
         """Make sure "greater than" conditions behave correctly."""
         condition = parse_condition(GREATER_THAN_PREFIX + '6')
@@ -113,8 +105,7 @@ class TestConditions(unittest.TestCase):
 
         self.assertEqual(condition, GreaterThan(6))
         self.assertEqual(condition.number, 6)
-        with self.assertRaises(FrozenInstanceError):
-            setattr(condition, 'number', 1)
+        assert_frozen(self, condition, number=condition.number + 1)
 
         self.assertEqual(repr(condition), 'GreaterThan(6)')
         self.assertEqual(
@@ -133,9 +124,6 @@ class TestConditions(unittest.TestCase):
         self.assertIsNone(GreaterThan.maybe_parse(EQUAL_SYMBOL))
         self.assertIsNone(GreaterThan.maybe_parse(NOT_EQUAL_SYMBOL))
 
-        for invalid in INVALID_CONDITION_STRINGS:
-            self.assertIsNone(GreaterThan.maybe_parse(invalid))
-
     def test_less_than_condition(self):
         """Make sure "less than" conditions behave correctly."""
         condition = parse_condition('<3')
@@ -146,8 +134,7 @@ class TestConditions(unittest.TestCase):
 
         self.assertEqual(condition, LessThan(3))
         self.assertEqual(condition.number, 3)
-        with self.assertRaises(FrozenInstanceError):
-            setattr(condition, 'number', 12)
+        assert_frozen(self, condition, number=condition.number + 1)
 
         self.assertEqual(repr(condition), 'LessThan(3)')
         self.assertEqual(condition.as_terse_string(), '<3')
@@ -163,14 +150,48 @@ class TestConditions(unittest.TestCase):
         self.assertIsNone(LessThan.maybe_parse(EQUAL_SYMBOL))
         self.assertIsNone(LessThan.maybe_parse(NOT_EQUAL_SYMBOL))
 
-        for invalid in INVALID_CONDITION_STRINGS:
-            self.assertIsNone(LessThan.maybe_parse(invalid))
-
     def test_parse_condition_for_invalid(self):
         """Make sure that parse_condition() raises for invalid inputs."""
         for invalid in INVALID_CONDITION_STRINGS:
             with self.assertRaises(ValueError):
                 parse_condition(invalid)
+        # Collect any invalid strings that some condition type accepts, so
+        # that one assertion covers every type and reports all the failures
+        condition_types = [Number, Equal, NotEqual, GreaterThan, LessThan]
+        wrongly_parsed = [
+            (condition_type.__name__, invalid)
+            for invalid in INVALID_CONDITION_STRINGS
+            for condition_type in condition_types
+            if condition_type.maybe_parse(invalid) is not None
+        ]
+        self.assertListEqual(wrongly_parsed, [])
+        for out_of_range in ['-3', LESS_THAN_PREFIX + '0']:
+            with self.assertRaisesRegex(ValueError, 'invalid terse'):
+                parse_condition(out_of_range)
+
+    def test_parse_condition_int_compatible(self):
+        """Check int()-style number parsing and digit-only prefixed numbers."""
+        strings_and_conditions = [
+            ('+5', Number(5)),
+            ('05', Number(5)),
+            ('1_0', Number(10)),
+            ('-0', Number(0)),
+            (' 7 ', Number(7)),
+            ('\u0663', Number(3)),
+            (GREATER_THAN_PREFIX + '\u0663', GreaterThan(3)),
+            (LESS_THAN_PREFIX + '08', LessThan(8)),
+        ]
+        for string, condition in strings_and_conditions:
+            self.assertEqual(parse_condition(string), condition)
+        self.assertEqual(Number.maybe_parse('+3'), Number(3))
+        for invalid in [GREATER_THAN_PREFIX + '+3', LESS_THAN_PREFIX + '1_0']:
+            with self.assertRaises(ValueError):
+                parse_condition(invalid)
+
+    def test_parse_condition_cached(self):
+        """Check that repeated condition strings share one parsed result."""
+        for string in ['8', EQUAL_SYMBOL, GREATER_THAN_PREFIX + '2', '<5']:
+            self.assertIs(parse_condition(string), parse_condition(string))
 
     def test_condition_matching(self):
         """Test that conditions work properly in match-case statements."""
@@ -1,6 +1,5 @@
 """Unit tests for the dominoes that act as playing pieces for Pips."""
 
-from dataclasses import FrozenInstanceError
 import itertools
 import random
 from typing import Final
@@ -12,20 +11,26 @@ from dominoes import (
     MIN_DOTS,
     parse_dominoes,
 )
+from tests.helpers import assert_frozen
 
 
 # Test fixture: a constant list containing all valid domino dots values.
 VALID_DOTS: Final[list[int]] = list(range(MIN_DOTS, MAX_DOTS + 1))
 
+# Test fixture: a constant tuple of every ordered pair of valid dots values.
+VALID_DOTS_PAIRS: Final[tuple[tuple[int, int], ...]] = tuple(
+    itertools.product(VALID_DOTS, VALID_DOTS)
+)
+
 
 class TestDominoes(unittest.TestCase):
     """Test case for the Pips domino pieces."""
 
     def test_domino_init(self):
         """Check that domino objects can be initialized correctly."""
-        for dots_1, dots_2 in itertools.product(VALID_DOTS, VALID_DOTS):
+        for dots_1, dots_2 in VALID_DOTS_PAIRS:
             domino = Domino(dots_1, dots_2)
-            self.assertSetEqual(set(domino.dots), {dots_1, dots_2})
+            self.assertEqual(domino.dots, tuple(sorted((dots_1, dots_2))))
         invalid_dots = [
             MIN_DOTS - 4, MIN_DOTS - 3, MIN_DOTS - 2, MIN_DOTS - 1,
             MAX_DOTS + 1, MAX_DOTS + 2, MAX_DOTS + 3, MAX_DOTS + 4,
@@ -39,26 +44,36 @@ class TestDominoes(unittest.TestCase):
 
     def test_domino_eq_and_ne(self):
         """Ensure that domino equality is independent of the dots order."""
-        for dots_a, dots_b in itertools.product(VALID_DOTS, VALID_DOTS):
+        for dots_a, dots_b in VALID_DOTS_PAIRS:
             domino_ab = Domino(dots_a, dots_b)
             domino_ba = Domino(dots_b, dots_a)
             self.assertEqual(domino_ab, domino_ba)
-        for dots_a, dots_b, dots_c, dots_d in itertools.product(
-            VALID_DOTS, VALID_DOTS, VALID_DOTS, VALID_DOTS,
+        # Build both orientations of each unordered dots pair up front, then
+        # compare each pair of different unordered dots pairs just once
+        oriented_dominoes = [
+            (Domino(dots_a, dots_b), Domino(dots_b, dots_a))
+            for dots_a, dots_b in itertools.combinations_with_replacement(
+                VALID_DOTS, 2,
+            )
+        ]
+        for (domino_ab, domino_ba), (domino_cd, domino_dc) in (
+            itertools.combinations(oriented_dominoes, 2)
         ):
-            if {dots_a, dots_b} != {dots_c, dots_d}:
-                domino_ab = Domino(dots_a, dots_b)
-                domino_ba = Domino(dots_b, dots_a)
-                domino_cd = Domino(dots_c, dots_d)
-                domino_dc = Domino(dots_d, dots_c)
-                self.assertNotEqual(domino_ab, domino_cd)
-                self.assertNotEqual(domino_ba, domino_cd)
-                self.assertNotEqual(domino_ab, domino_dc)
-                self.assertNotEqual(domino_ba, domino_dc)
+            self.assertNotEqual(domino_ab, domino_cd)
+            self.assertNotEqual(domino_ba, domino_cd)
+            self.assertNotEqual(domino_ab, domino_dc)
+            self.assertNotEqual(domino_ba, domino_dc)
+
+    def test_domino_shared(self):
+        """Check that dominoes are shared objects for each dots ordering."""
+        for dots_1, dots_2 in VALID_DOTS_PAIRS:
+            domino = Domino(dots_1, dots_2)
+            self.assertIs(Domino(dots_1, dots_2), domino)
+            self.assertTupleEqual(tuple(domino), (dots_1, dots_2))
 
     def test_domino_parse(self):
         """Test parsing of simple terse domino strings."""
-        for dots_1, dots_2 in itertools.product(VALID_DOTS, VALID_DOTS):
+        for dots_1, dots_2 in VALID_DOTS_PAIRS:
             dots_1_str = str(dots_1)
             self.assertEqual(len(dots_1_str), 1)
             dots_2_str = str(dots_2)
@@ -69,19 +84,19 @@ class TestDominoes(unittest.TestCase):
 
     def test_domino_iter(self):
         """Check that domino dots values can be iterated over."""
-        for dots_1, dots_2 in itertools.product(VALID_DOTS, VALID_DOTS):
+        for dots_1, dots_2 in VALID_DOTS_PAIRS:
             domino = Domino(dots_1, dots_2)
-            self.assertListEqual(list(iter(domino)), [dots_1, dots_2])
+            self.assertTupleEqual(tuple(domino), (dots_1, dots_2))
 
     def test_domino_len(self):
         """Test that a domino's length is always 2."""
-        for dots_1, dots_2 in itertools.product(VALID_DOTS, VALID_DOTS):
+        for dots_1, dots_2 in VALID_DOTS_PAIRS:
             domino = Domino(dots_1, dots_2)
             self.assertEqual(len(domino), 2)
 
     def test_domino_str_and_repr(self):
         """Make sure the domino str and repr methods work as expected."""
-        for dots_1, dots_2 in itertools.product(VALID_DOTS, VALID_DOTS):
+        for dots_1, dots_2 in VALID_DOTS_PAIRS:
             domino = Domino(dots_1, dots_2)
             expected_str = str(dots_1) + str(dots_2)
             self.assertEqual(str(domino), expected_str)
@@ -91,12 +106,11 @@ class TestDominoes(unittest.TestCase):
     def test_domino_frozen(self):
         """Ensure that domino objects have frozen attributes."""
         domino = Domino(MAX_DOTS, MIN_DOTS)
-        with self.assertRaises(FrozenInstanceError):
-            setattr(domino, 'dots', (MIN_DOTS, MAX_DOTS))
+        assert_frozen(self, domino, dots=(MIN_DOTS, MAX_DOTS))
 
     def test_domino_is_symmetric(self):
         """Test that dominoes know when they are symmetric."""
-        for dots_1, dots_2 in itertools.product(VALID_DOTS, VALID_DOTS):
+        for dots_1, dots_2 in VALID_DOTS_PAIRS:
             domino = Domino(dots_1, dots_2)
             if dots_1 == dots_2:
                 self.assertTrue(domino.is_symmetric())
@@ -107,29 +121,24 @@ class TestDominoes(unittest.TestCase):
         """Try parsing a long string of whitespace-separated dominoes."""
         dominoes = [
             Domino(dots_1, dots_2)
-            for dots_1, dots_2 in itertools.product(VALID_DOTS, VALID_DOTS)
+            for dots_1, dots_2 in VALID_DOTS_PAIRS
         ]
         random.shuffle(dominoes)
 
         whitespace = [' ', '\t', '\n']
-        string_parts = []
-
-        # Random leading whitespace
-        for _ in range(random.randint(0, 2)):
-            string_parts.append(random.choice(whitespace))
-
-        # Two-digit domino strings separated by random whitespace
-        for i, domino in enumerate(dominoes):
-            if i > 0:
-                for _ in range(random.randint(1, 3)):
-                    string_parts.append(random.choice(whitespace))
-            dots_1, dots_2 = domino
-            string_parts.append(str(dots_1))
-            string_parts.append(str(dots_2))
-
-        # Random trailing whitespace
-        for _ in range(random.randint(0, 2)):
-            string_parts.append(random.choice(whitespace))
+
+        # Two-digit domino strings separated by random whitespace, with some
+        # random leading and trailing whitespace as well. All of the gap sizes
+        # are drawn at once, and each gap's characters take one more draw.
+        gap_sizes = random.choices(range(1, 4), k=len(dominoes) - 1)
+        gap_sizes = [random.randint(0, 2)] + gap_sizes + [random.randint(0, 2)]
+        gaps = [
+            ''.join(random.choices(whitespace, k=size)) for size in gap_sizes
+        ]
+        string_parts = [gaps[0]]
+        for domino, gap in zip(dominoes, gaps[1:]):
+            string_parts.append(str(domino))
+            string_parts.append(gap)
 
         string = ''.join(string_parts)
         self.assertListEqual(parse_dominoes(string), dominoes)
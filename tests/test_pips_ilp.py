@@ -0,0 +1,45 @@
+"""Unit tests for reading results back out of the Pips ILP formulation."""
+
+import unittest
+
+from dominoes import Domino
+from pips_ilp import formulate_ilp
+from puzzle import Puzzle
+from spaces import (
+    LEFTMOST_COLUMN,
+    Space,
+    TOPMOST_ROW,
+)
+from spots import Spot
+
+
+class TestPipsILP(unittest.TestCase):
+    """Test case for the Pips ILP formulation object."""
+
+    def test_iter_active_placements(self):
+        """Check the chosen placements using placement values set by hand."""
+        puzzle = Puzzle.parse('AB\nC#\n\nA 1\nB 2\nC 3\n\n12 33')
+        ilp = formulate_ilp(puzzle)
+        space_a = Space(TOPMOST_ROW, LEFTMOST_COLUMN)
+        space_b = space_a.shift_by(delta_c=1)
+        space_c = space_a.shift_by(delta_r=1)
+        space_d = space_c.shift_by(delta_c=1)
+        chosen_placements = [
+            (Domino(1, 2), Spot(space_a, space_b)),
+            (Domino(3, 3), Spot(space_c, space_d)),
+        ]
+
+        for placement_var in ilp.placement_vars.values():
+            placement_var.varValue = 0.0
+        self.assertListEqual(list(ilp.iter_active_placements()), [])
+
+        for placement in chosen_placements:
+            ilp.placement_vars[placement].varValue = 1.0
+        self.assertCountEqual(
+            ilp.iter_active_placements(), chosen_placements,
+        )
+
+        # Symmetric dominoes have no variables for spots that aren't sorted
+        self.assertNotIn(
+            (Domino(3, 3), Spot(space_d, space_c)), ilp.placement_vars,
+        )
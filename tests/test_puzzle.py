@@ -9,6 +9,7 @@ from conditions import (
     NotEqual,
     Number,
 )
+from dominoes import Domino
 from puzzle import (
     parse_region_conditions,
     Puzzle,
@@ -19,6 +20,7 @@ from spaces import (
     Space,
     TOPMOST_ROW,
 )
+from spots import Spot
 
 
 class TestPuzzle(unittest.TestCase):
@@ -50,7 +52,7 @@ class TestPuzzle(unittest.TestCase):
         puzzle = Puzzle([], {}, [])
         self.assertSetEqual(puzzle.spaces, set())
         self.assertDictEqual(puzzle.regions, {})
-        self.assertListEqual(puzzle.dominoes, [])
+        self.assertTupleEqual(puzzle.dominoes, ())
 
     def test_puzzle_add_space(self):
         """Check that spaces can be added to an empty puzzle."""
@@ -63,8 +65,14 @@ class TestPuzzle(unittest.TestCase):
         puzzle = Puzzle([], {}, [])
         puzzle.add_space(space_a)
         puzzle.add_space(space_b)
+        self.assertTrue(space_b in puzzle)
+        self.assertFalse(space_c in puzzle)
+        self.assertListEqual(list(puzzle.iter_sorted_spots()), [])
         puzzle.add_space(space_c)
         puzzle.add_space(space_d)
+        self.assertTrue(space_c in puzzle)
+        self.assertEqual(puzzle.num_spaces, 4)
+        self.assertEqual(len(list(puzzle.iter_sorted_spots())), 6)
 
         self.assertSetEqual(puzzle.spaces, spaces_set)
 
@@ -94,7 +102,9 @@ class TestPuzzle(unittest.TestCase):
         puzzle.add_space(space_c)
         puzzle.add_space(space_d)
         puzzle.add_region_with_condition(region_ac, LessThan(4))
+        self.assertTupleEqual(puzzle.sorted_regions, (region_ac,))
         puzzle.add_region_with_condition(region_bd, NotEqual())
+        self.assertTupleEqual(puzzle.sorted_regions, (region_ac, region_bd))
 
         self.assertDictEqual(puzzle.regions, expected_regions_dict)
 
@@ -107,6 +117,27 @@ class TestPuzzle(unittest.TestCase):
                 Region([space_d.shift_by(delta_r=10)]), GreaterThan(0),
             )
 
+    def test_puzzle_regions_outside_board(self):
+        """Test region overlaps for unchecked spaces outside of the board."""
+        space_a = Space(TOPMOST_ROW, LEFTMOST_COLUMN + 2)
+        space_b = Space(
+            TOPMOST_ROW + 1, LEFTMOST_COLUMN - 2, unchecked=True,
+        )
+        space_c = Space(TOPMOST_ROW - 3, LEFTMOST_COLUMN, unchecked=True)
+        space_d = space_c.shift_by(delta_c=1)
+        puzzle = Puzzle(
+            [space_a, space_b, space_c, space_d], {},
+            [Domino(1, 2), Domino(3, 4)],
+        )
+        puzzle.add_region_with_condition(Region([space_a]), Number(2))
+        puzzle.add_region_with_condition(Region([space_b]), Number(3))
+        puzzle.add_region_with_condition(Region([space_c]), Equal())
+        self.assertEqual(puzzle.num_regions, 3)
+        with self.assertRaisesRegex(ValueError, 'may not overlap'):
+            puzzle.add_region_with_condition(
+                Region([space_c, space_d]), NotEqual(),
+            )
+
     def test_puzzle_parse(self):
         """Test that a puzzle object can be parsed from a string."""
         puzzle_string = "ABB#\n B\n B\n\nA 6\nB ="
@@ -150,6 +181,15 @@ class TestPuzzle(unittest.TestCase):
         self.assertEqual(puzzle.num_rows, 2)
         self.assertEqual(puzzle.num_columns, 5)
         self.assertEqual(puzzle.num_regions, 4)
+        self.assertTupleEqual(
+            puzzle.bounding_box,
+            (
+                TOPMOST_ROW + 0, TOPMOST_ROW + 1,
+                LEFTMOST_COLUMN + 0, LEFTMOST_COLUMN + 4,
+            ),
+        )
+        with self.assertRaisesRegex(ValueError, 'no bounding box'):
+            Puzzle([], {}, []).bounding_box
 
     def test_puzzle_iter_sorted_spaces(self):
         """Test iteration over a puzzle's spaces in sorted order."""
@@ -170,6 +210,40 @@ class TestPuzzle(unittest.TestCase):
             list(puzzle.iter_sorted_spaces()),
             [space_a, space_b, space_c, space_d, space_e],
         )
+        self.assertTupleEqual(
+            puzzle.sorted_spaces,
+            (space_a, space_b, space_c, space_d, space_e),
+        )
+
+    def test_puzzle_iter_sorted_spots(self):
+        """Check the puzzle's spots, including for spaces outside the board."""
+        top_left = Space(TOPMOST_ROW, LEFTMOST_COLUMN)
+        right = top_left.shift_by(delta_c=1)
+        puzzle = Puzzle([top_left, right], {}, [Domino(1, 2)])
+        self.assertListEqual(
+            list(puzzle.iter_sorted_spots()),
+            [Spot(top_left, right), Spot(right, top_left)],
+        )
+
+        # An unchecked space left of the board isn't next to the last space
+        # in the row above it, even when the columns would wrap around
+        space_a = top_left.shift_by(delta_c=1)
+        space_b = Space(
+            TOPMOST_ROW + 1, LEFTMOST_COLUMN - 1, unchecked=True,
+        )
+        puzzle = Puzzle([space_a, space_b], {}, [Domino(1, 2)])
+        self.assertListEqual(list(puzzle.iter_sorted_spots()), [])
+
+        # Spaces above the board still have spots between them as well
+        space_c = Space(TOPMOST_ROW - 2, LEFTMOST_COLUMN, unchecked=True)
+        space_d = space_c.shift_by(delta_c=1)
+        puzzle = Puzzle([space_c, space_d], {}, [Domino(1, 2)])
+        self.assertListEqual(
+            list(puzzle.iter_sorted_spots()),
+            [Spot(space_c, space_d), Spot(space_d, space_c)],
+        )
+        self.assertTrue(space_c in puzzle)
+        self.assertFalse(top_left in puzzle)
 
     def test_puzzle_iter_sorted_regions(self):
         """Test iteration over a puzzle's regions in sorted order."""
@@ -212,6 +286,12 @@ class TestPuzzle(unittest.TestCase):
 
         self.assertTrue(top_left in puzzle)
         self.assertFalse(top_left.shift_by(delta_r=15) in puzzle)
+        self.assertFalse(top_left.shift_by(delta_c=1) in puzzle)
+        self.assertTrue(top_left.shift_by(delta_r=1, delta_c=2) in puzzle)
+        self.assertFalse(top_left.shift_by(delta_r=1, delta_c=3) in puzzle)
+        self.assertFalse(top_left.shift_by(delta_c=5) in puzzle)
+        self.assertFalse(top_left.shift_by(delta_r=-3) in puzzle)
+        self.assertFalse(top_left.shift_by(delta_c=-3) in puzzle)
 
         self.assertTrue(Region([top_left]) in puzzle)
         self.assertFalse(
@@ -219,6 +299,10 @@ class TestPuzzle(unittest.TestCase):
         )
         self.assertFalse(Region([top_left.shift_by(delta_c=20)]) in puzzle)
 
+        self.assertTrue(Domino(4, 3) in puzzle)
+        self.assertTrue(Domino(1, 2) in puzzle)
+        self.assertFalse(Domino(4, 2) in puzzle)
+
     def test_puzzle_repr(self):
         """Test that a puzzle can produce a sensible string repr."""
         puzzle = Puzzle.parse("A..BBB\n\nA 3\nB =\n\n21 35 06")
@@ -1,7 +1,7 @@
 """Unit tests for the functionality of Pips board regions."""
 
-from dataclasses import FrozenInstanceError
 import random
+from typing import Final
 import unittest
 
 from regions import (
@@ -12,6 +12,19 @@ from spaces import (
     Space,
     TOPMOST_ROW,
 )
+from tests.helpers import assert_frozen
+
+
+# Test fixture: a constant grid of spaces, with GRID[i][j] in row i and column
+# j counting from the top left corner of the board. Building every space once
+# up front saves the tests from constructing the same spaces over and over.
+GRID: Final[tuple[tuple[Space, ...], ...]] = tuple(
+    tuple(
+        Space(TOPMOST_ROW + delta_r, LEFTMOST_COLUMN + delta_c)
+        for delta_c in range(5)
+    )
+    for delta_r in range(5)
+)
 
 
 class TestRegions(unittest.TestCase):
@@ -20,11 +33,11 @@ class TestRegions(unittest.TestCase):
     def test_region_init(self):
         """Test that regions can be initialized correctly."""
         spaces = {
-            Space(TOPMOST_ROW + 1, LEFTMOST_COLUMN + 0),
-            Space(TOPMOST_ROW + 1, LEFTMOST_COLUMN + 1),
-            Space(TOPMOST_ROW + 0, LEFTMOST_COLUMN + 1),
-            Space(TOPMOST_ROW + 0, LEFTMOST_COLUMN + 2),
-            Space(TOPMOST_ROW + 0, LEFTMOST_COLUMN + 3),
+            GRID[1][0],
+            GRID[1][1],
+            GRID[0][1],
+            GRID[0][2],
+            GRID[0][3],
         }
 
         region = Region(spaces)
@@ -38,22 +51,11 @@ class TestRegions(unittest.TestCase):
     def test_region_init_disconnected(self):
         """Test that regions enforce connectedness."""
         disconnected_spaces = [
-            [
-                Space(TOPMOST_ROW, LEFTMOST_COLUMN),
-                Space(TOPMOST_ROW, LEFTMOST_COLUMN + 2),
-            ],
-            [
-                Space(TOPMOST_ROW, LEFTMOST_COLUMN),
-                Space(TOPMOST_ROW + 2, LEFTMOST_COLUMN),
-            ],
-            [
-                Space(TOPMOST_ROW, LEFTMOST_COLUMN),
-                Space(TOPMOST_ROW + 1, LEFTMOST_COLUMN + 1),
-            ],
-            [
-                Space(TOPMOST_ROW + 1, LEFTMOST_COLUMN),
-                Space(TOPMOST_ROW, LEFTMOST_COLUMN + 1),
-            ],
+            [GRID[0][0], GRID[0][2]],
+            [GRID[0][0], GRID[2][0]],
+            [GRID[0][0], GRID[1][1]],
+            [GRID[1][0], GRID[0][1]],
+            [GRID[0][2], GRID[0][3], GRID[1][0], GRID[1][1]],
         ]
         for disconnected in disconnected_spaces:
             with self.assertRaisesRegex(ValueError, 'must all be connected'):
@@ -62,92 +64,83 @@ class TestRegions(unittest.TestCase):
     def test_region_repr(self):
         """Check that the region object's repr method works."""
         spaces = [
-            Space(TOPMOST_ROW + 0, LEFTMOST_COLUMN + 0),
-            Space(TOPMOST_ROW + 0, LEFTMOST_COLUMN + 1),
-            Space(TOPMOST_ROW + 1, LEFTMOST_COLUMN + 1),
-            Space(TOPMOST_ROW + 2, LEFTMOST_COLUMN + 1),
-            Space(TOPMOST_ROW + 2, LEFTMOST_COLUMN + 0),
+            GRID[0][0],
+            GRID[0][1],
+            GRID[1][1],
+            GRID[2][1],
+            GRID[2][0],
         ]
         expected_repr = 'Region(' + repr(sorted(spaces)) + ')'
         self.assertEqual(repr(Region(spaces)), expected_repr)
 
     def test_region_iter(self):
         """Test that regions can be iterated over."""
-        spaces = [
-            Space(TOPMOST_ROW + 2, LEFTMOST_COLUMN + 0),
-            Space(TOPMOST_ROW + 0, LEFTMOST_COLUMN + 0),
-            Space(TOPMOST_ROW + 1, LEFTMOST_COLUMN + 0),
-            Space(TOPMOST_ROW + 1, LEFTMOST_COLUMN + 1),
-        ]
-        self.assertListEqual(list(iter(Region(spaces))), sorted(spaces))
+        spaces = [GRID[2][0], GRID[0][0], GRID[1][0], GRID[1][1]]
+        self.assertTupleEqual(tuple(Region(spaces)), tuple(sorted(spaces)))
 
     def test_region_len(self):
         """Test that a region's length is the number of spaces in it."""
         spaces = [
-            Space(TOPMOST_ROW + 2, LEFTMOST_COLUMN + 0),
-            Space(TOPMOST_ROW + 2, LEFTMOST_COLUMN + 1),
-            Space(TOPMOST_ROW + 2, LEFTMOST_COLUMN + 2),
-            Space(TOPMOST_ROW + 2, LEFTMOST_COLUMN + 3),
-            Space(TOPMOST_ROW + 2, LEFTMOST_COLUMN + 4),
-            Space(TOPMOST_ROW + 1, LEFTMOST_COLUMN + 4),
-            Space(TOPMOST_ROW + 0, LEFTMOST_COLUMN + 4),
-            Space(TOPMOST_ROW + 0, LEFTMOST_COLUMN + 3),
+            GRID[2][0],
+            GRID[2][1],
+            GRID[2][2],
+            GRID[2][3],
+            GRID[2][4],
+            GRID[1][4],
+            GRID[0][4],
+            GRID[0][3],
         ]
         for length in range(1, len(spaces) + 1):
             region = Region(spaces[:length])
             self.assertEqual(len(region), length)
 
+    def test_region_contains(self):
+        """Test that regions work correctly with the "in" operator."""
+        space_a = GRID[1][2]
+        space_b = space_a.shift_by(delta_c=1)
+        region = Region([space_a, space_b])
+
+        self.assertTrue(space_a in region)
+        self.assertTrue(space_b in region)
+        self.assertFalse(space_a.shift_by(delta_c=-1) in region)
+        self.assertFalse(space_b.shift_by(delta_r=1) in region)
+        self.assertFalse((space_a.r, space_a.c) in region)
+
     def test_region_ordering(self):
         """Check that regions are ordered by spaces tuples as expected."""
+        # Grow each random region by a random walk on a 4x4 grid, stepping
+        # from one of its spaces to a neighbor, so it is always connected.
+        steps = [(1, 0), (-1, 0), (0, 1), (0, -1)]
         regions = []
-        while len(regions) < 50:
-            spaces = set()
-            for _ in range(8):
-                space = Space(
-                    TOPMOST_ROW + random.randrange(4),
-                    LEFTMOST_COLUMN + random.randrange(4),
-                )
-                spaces.add(space)
-            try:
-                region = Region(spaces)
-            except ValueError as exc:
-                if 'connected' in exc.args[0]:
-                    continue
-                assert False, 'failed to generate random regions'
-            regions.append(region)
+        for _ in range(50):
+            spaces = [GRID[random.randrange(4)][random.randrange(4)]]
+            size = random.randint(1, 8)
+            while len(spaces) < size:
+                space = random.choice(spaces)
+                delta_r, delta_c = random.choice(steps)
+                row = space.r - TOPMOST_ROW + delta_r
+                column = space.c - LEFTMOST_COLUMN + delta_c
+                if 0 <= row < 4 and 0 <= column < 4:
+                    neighbor = GRID[row][column]
+                    if neighbor not in spaces:
+                        spaces.append(neighbor)
+            regions.append(Region(spaces))
         regions.sort()
-        for i in range(len(regions) - 1):
-            tuple_1 = tuple(iter(regions[i]))
-            tuple_2 = tuple(iter(regions[i + 1]))
+        region_tuples = [tuple(iter(region)) for region in regions]
+        for tuple_1, tuple_2 in zip(region_tuples, region_tuples[1:]):
             self.assertLessEqual(tuple_1, tuple_2)
 
     def test_region_frozen(self):
         """Check that region objects are indeed frozen."""
-        region = Region([
-            Space(TOPMOST_ROW + 1, LEFTMOST_COLUMN + 1),
-            Space(TOPMOST_ROW + 1, LEFTMOST_COLUMN + 2),
-        ])
-        with self.assertRaises(FrozenInstanceError):
-            setattr(region, 'spaces', ())
+        region = Region([GRID[1][1], GRID[1][2]])
+        assert_frozen(self, region, spaces=())
 
     def test_region_overlaps_with(self):
         """Check that regions are able to detect whether they overlap."""
-        region_row_0 = Region([
-            Space(TOPMOST_ROW + 0, LEFTMOST_COLUMN + 0),
-            Space(TOPMOST_ROW + 0, LEFTMOST_COLUMN + 1),
-        ])
-        region_row_1 = Region([
-            Space(TOPMOST_ROW + 1, LEFTMOST_COLUMN + 0),
-            Space(TOPMOST_ROW + 1, LEFTMOST_COLUMN + 1),
-        ])
-        region_col_0 = Region([
-            Space(TOPMOST_ROW + 0, LEFTMOST_COLUMN + 0),
-            Space(TOPMOST_ROW + 1, LEFTMOST_COLUMN + 0),
-        ])
-        region_col_1 = Region([
-            Space(TOPMOST_ROW + 0, LEFTMOST_COLUMN + 1),
-            Space(TOPMOST_ROW + 1, LEFTMOST_COLUMN + 1),
-        ])
+        region_row_0 = Region([GRID[0][0], GRID[0][1]])
+        region_row_1 = Region([GRID[1][0], GRID[1][1]])
+        region_col_0 = Region([GRID[0][0], GRID[1][0]])
+        region_col_1 = Region([GRID[0][1], GRID[1][1]])
         regions = [region_row_0, region_row_1, region_col_0, region_col_1]
 
         for region in regions:
@@ -168,3 +161,15 @@ class TestRegions(unittest.TestCase):
         self.assertTrue(region_col_1.overlaps_with(region_row_0))
         self.assertTrue(region_col_1.overlaps_with(region_row_1))
         self.assertFalse(region_col_1.overlaps_with(region_col_0))
+
+        far_space = Space(TOPMOST_ROW, LEFTMOST_COLUMN + 100)
+        region_far = Region([far_space, far_space.shift_by(delta_c=-1)])
+        region_wide = Region(
+            Space(TOPMOST_ROW, LEFTMOST_COLUMN + delta_c)
+            for delta_c in range(100)
+        )
+        self.assertTrue(region_far.overlaps_with(region_far))
+        self.assertTrue(region_far.overlaps_with(region_wide))
+        self.assertTrue(region_wide.overlaps_with(region_row_0))
+        self.assertFalse(region_far.overlaps_with(region_row_0))
+        self.assertFalse(region_row_1.overlaps_with(region_wide))
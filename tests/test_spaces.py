@@ -1,6 +1,5 @@
 """Unit tests for the functionality of the Pips board spaces."""
 
-from dataclasses import FrozenInstanceError
 import random
 import unittest
 
@@ -10,6 +9,7 @@ from spaces import (
     Space,
     TOPMOST_ROW,
 )
+from tests.helpers import assert_frozen
 
 
 class TestSpaces(unittest.TestCase):
@@ -49,6 +49,23 @@ class TestSpaces(unittest.TestCase):
             self.assertEqual(space.r, r)
             self.assertEqual(space.c, c)
 
+    def test_space_intern(self):
+        """Check that interning shares one space object for each coordinate."""
+        rc_pairs = [
+            (TOPMOST_ROW + 3, LEFTMOST_COLUMN + 1),
+            (TOPMOST_ROW - 1, LEFTMOST_COLUMN + 2),
+            (TOPMOST_ROW + 2, LEFTMOST_COLUMN - 4),
+        ]
+        for r, c in rc_pairs:
+            space = Space.intern(r, c)
+            self.assertEqual(space, Space(r, c, unchecked=True))
+            self.assertIs(Space.intern(r, c), space)
+        space = Space(TOPMOST_ROW + 1, LEFTMOST_COLUMN + 1)
+        self.assertIs(
+            space.shift_by(delta_r=1), space.shift_by(delta_r=1),
+        )
+        self.assertIs(space.shift_by(delta_r=0, delta_c=0), space)
+
     def test_space_parse(self):
         """Test parsing spaces from row and column coordinate strings."""
         for delta_r in range(12):
@@ -99,14 +116,52 @@ class TestSpaces(unittest.TestCase):
             random.shuffle(shuffled)
         shuffled.sort()
         self.assertListEqual(shuffled, sorted_spaces)
+        for space_1, space_2 in zip(sorted_spaces, sorted_spaces[1:]):
+            self.assertLess(space_1, space_2)
+            self.assertLessEqual(space_1, space_2)
+            self.assertGreater(space_2, space_1)
+            self.assertGreaterEqual(space_2, space_1)
+            self.assertLessEqual(space_1, space_1)
+        self.assertLess(
+            Space(TOPMOST_ROW, LEFTMOST_COLUMN + 40),
+            Space(TOPMOST_ROW + 1, LEFTMOST_COLUMN - 40, unchecked=True),
+        )
+        for c in [1 << 16, (1 << 16) + 1, 1 << 40]:
+            wide_space = Space(TOPMOST_ROW, LEFTMOST_COLUMN + c)
+            next_row_space = Space(TOPMOST_ROW + 1, LEFTMOST_COLUMN)
+            self.assertLess(wide_space, next_row_space)
+            self.assertGreater(next_row_space, wide_space)
+            self.assertListEqual(
+                sorted([next_row_space, wide_space]),
+                [wide_space, next_row_space],
+            )
+
+    def test_space_eq_and_hash(self):
+        """Check that equal spaces compare and hash the same way."""
+        r, c = TOPMOST_ROW + 3, LEFTMOST_COLUMN + 5
+        space = Space(r, c)
+        self.assertEqual(space, Space(r, c))
+        self.assertEqual(hash(space), hash(Space(r, c)))
+        self.assertEqual(space, Space.intern(r, c))
+        self.assertNotEqual(space, Space(r, c + 1))
+        self.assertNotEqual(space, Space(r + 1, c))
+        self.assertNotEqual(space, (r, c))
+        self.assertEqual(len({space, Space(r, c), Space.intern(r, c)}), 1)
+
+    def test_space_eq_for_large_columns(self):
+        """Make sure spaces with very large column numbers stay distinct."""
+        for c in [1 << 16, (1 << 16) + 1, 1 << 40]:
+            wide_space = Space(TOPMOST_ROW, LEFTMOST_COLUMN + c)
+            for delta_r in range(1, 4):
+                other = Space(TOPMOST_ROW + delta_r, LEFTMOST_COLUMN)
+                self.assertNotEqual(wide_space, other)
+                self.assertEqual(len({wide_space, other}), 2)
+        self.assertNotEqual(Space.parse('1,65537'), Space.parse('2,1'))
 
     def test_space_frozen(self):
         """Make sure that space objects are indeed frozen."""
         space = Space(TOPMOST_ROW + 2, LEFTMOST_COLUMN + 1)
-        with self.assertRaises(FrozenInstanceError):
-            setattr(space, 'r', TOPMOST_ROW + 4)
-        with self.assertRaises(FrozenInstanceError):
-            setattr(space, 'c', LEFTMOST_COLUMN + 3)
+        assert_frozen(self, space, r=TOPMOST_ROW + 4, c=LEFTMOST_COLUMN + 3)
 
     def test_parse_board_layout(self):
         """Check that a very simple board layout can be correctly parsed."""
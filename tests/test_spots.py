@@ -1,6 +1,5 @@
 """Unit tests for the space pairs that we call "spots" officially."""
 
-from dataclasses import FrozenInstanceError
 import random
 import unittest
 
@@ -19,6 +18,7 @@ from spots import (
     get_sorted_spots,
     Spot,
 )
+from tests.helpers import assert_frozen
 
 
 class TestSpots(unittest.TestCase):
@@ -47,15 +47,26 @@ class TestSpots(unittest.TestCase):
             with self.assertRaisesRegex(ValueError, 'two adjacent spaces'):
                 Spot(space_a, space_a.shift_by(delta_r=dr, delta_c=dc))
 
+    def test_spot_init_unchecked(self):
+        """Ensure that unchecked initialization skips the adjacency check."""
+        space_a = Space(TOPMOST_ROW + 2, LEFTMOST_COLUMN + 1)
+        space_b = space_a.shift_by(delta_r=1)
+        space_c = space_a.shift_by(delta_r=2, delta_c=3)
+
+        spot_ab = Spot(space_a, space_b, unchecked=True)
+        self.assertEqual(spot_ab, Spot(space_a, space_b))
+        spot_ac = Spot(space_a, space_c, unchecked=True)
+        self.assertListEqual(list(spot_ac.spaces), [space_a, space_c])
+
     def test_spot_iter(self):
         """Test that spots can be iterated over."""
         space_a = Space(TOPMOST_ROW + 3, LEFTMOST_COLUMN + 1)
         space_b = space_a.shift_by(delta_c=1)
 
         spot_ab = Spot(space_a, space_b)
-        self.assertListEqual(list(iter(spot_ab)), [space_a, space_b])
+        self.assertTupleEqual(tuple(spot_ab), (space_a, space_b))
         spot_ba = Spot(space_b, space_a)
-        self.assertListEqual(list(iter(spot_ba)), [space_b, space_a])
+        self.assertTupleEqual(tuple(spot_ba), (space_b, space_a))
 
     def test_spot_parse(self):
         """Test parsing of spot objects from string coordinate pairs."""
@@ -163,8 +174,7 @@ class TestSpots(unittest.TestCase):
         space_a = Space(TOPMOST_ROW + 1, LEFTMOST_COLUMN + 1)
         space_b = Space(TOPMOST_ROW + 0, LEFTMOST_COLUMN + 1)
         spot_ab = Spot(space_a, space_b)
-        with self.assertRaises(FrozenInstanceError):
-            setattr(spot_ab, 'spaces', (space_b, space_a))
+        assert_frozen(self, spot_ab, spaces=(space_b, space_a))
 
     def test_get_sorted_spots(self):
         """Test the function that generates all sorted spots for a puzzle."""